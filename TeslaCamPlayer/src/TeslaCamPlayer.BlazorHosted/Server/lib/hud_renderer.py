@@ -2,12 +2,27 @@
 """
 Tesla Cam Player - HUD Renderer
 Generates graphical HUD overlays from SEI telemetry data using PIL/Pillow
+
+Output modes, fastest first:
+  --pipe                       raw RGBA frames on stdout; read with
+                               ffmpeg -f rawvideo -pix_fmt rgba -s WxH -framerate N -i -
+  --output-dir D --raw-frames  one raw RGBA file per frame (D/frame_%06d.rgba); read with
+                               ffmpeg -f image2 -c:v rawvideo -pix_fmt rgba -s WxH -framerate N -i D/frame_%06d.rgba
+  --output-dir D               PNG per frame (D/frame_%06d.png). Deprecated: pays for zlib
+                               compression of frames ffmpeg reads once; prefer --pipe.
 """
 
 import json
 import sys
 import argparse
+import io
 import math
+import os
+import shutil
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing import Pool
 from PIL import Image, ImageDraw, ImageFont
 
 # HUD Constants
@@ -19,6 +34,9 @@ HUD_BORDER_COLOR = (255, 255, 255, 42)
 HUD_GLOSS_COLOR = (255, 255, 255, 18)
 HUD_TEXT_COLOR = (245, 245, 245, 255)
 
+# Rows covered by the HUD; per-frame drawing happens in a strip of this height
+HUD_STRIP_HEIGHT = HUD_MARGIN_TOP + HUD_HEIGHT
+
 CHIP_SIZE = 42
 CHIP_RADIUS = 12
 CHIP_INNER_RADIUS = 10
@@ -31,6 +49,9 @@ SPEED_BLOCK_HALF_H = 25
 ICON_SUPERSAMPLE = 2
 
 BLINKER_COLOR = (120, 255, 140, 220)  # Green
+BLINK_PULSE_STEPS = 32  # distinct blinker intensities per blink
+BLINKER_IDLE_FILL = (22, 24, 26, 175)
+BLINKER_IDLE_ARROW = (210, 210, 210, 170)
 BRAKE_COLOR = (255, 90, 90, 230)  # Red
 THROTTLE_COLOR = (120, 255, 120, 220)  # Green
 AUTOPILOT_COLOR = (100, 170, 255, 230)  # Blue
@@ -45,6 +66,28 @@ LOCATION_PADDING = 8
 LOCATION_MARGIN_X = 10
 LOCATION_MARGIN_Y = 10
 
+# stdout buffer for --pipe, large enough to batch several full frames per write
+PIPE_BUFFER_SIZE = 64 * 1024 * 1024
+# zlib level for PNG frames; ffmpeg reads them once, so fast encoding beats small files
+PNG_COMPRESS_LEVEL = 1
+# Default worker cap; rendering is cheap enough that more processes mostly add memory
+MAX_DEFAULT_WORKERS = 8
+# Frames per task and tasks queued per worker; bounds how many frames sit in memory at once
+FILE_CHUNK_FRAMES = 32
+PIPE_CHUNK_FRAMES = 4
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Debug logging to stderr, enabled with --verbose
+VERBOSE = False
+
+# Candidate TrueType fonts, tried in order
+FONT_PATHS = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/System/Library/Fonts/Helvetica.ttc',
+    '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf'
+]
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Render HUD overlay from SEI telemetry')
     parser.add_argument('--sei-json', required=True, help='Path to SEI messages JSON file')
@@ -54,28 +97,30 @@ def parse_args():
     parser.add_argument('--use-mph', action='store_true', help='Use MPH instead of km/h')
     parser.add_argument('--output-dir', help='Output directory for PNG frames (if not using pipe)')
     parser.add_argument('--pipe', action='store_true', help='Output raw RGBA to stdout')
+    parser.add_argument('--raw-frames', action='store_true', help='With --output-dir, write raw RGBA .rgba files instead of PNG')
     parser.add_argument('--location-text', help='Street and city text (e.g., "Main St, San Francisco")')
     parser.add_argument('--fallback-lat', type=float, help='Fallback GPS latitude from event.json')
     parser.add_argument('--fallback-lon', type=float, help='Fallback GPS longitude from event.json')
     parser.add_argument('--enable-location-overlay', action='store_true', help='Render location overlay (city/GPS)')
+    parser.add_argument('--verbose', action='store_true', help='Write debug logging to stderr')
+    parser.add_argument('--workers', type=int, default=0, help=f'Render processes (default: one per available CPU, at most {MAX_DEFAULT_WORKERS})')
     return parser.parse_args()
 
+def debug_log(message):
+    if __debug__ and VERBOSE:
+        sys.stderr.write(message + "\n")
+
 def load_sei_messages(json_path):
     """Load SEI messages from JSON file"""
     with open(json_path, 'r') as f:
         messages = json.load(f)
     return messages
 
+@lru_cache(maxsize=None)
 def load_font(size):
-    """Try to load a TrueType font, fall back to default if not available"""
-    font_paths = [
-        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-        '/System/Library/Fonts/Helvetica.ttc',
-        '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf'
-    ]
-
-    for font_path in font_paths:
+    """Try to load a TrueType font, fall back to default if not available.
+    Cached per size so per-frame calls don't reopen the font file."""
+    for font_path in FONT_PATHS:
         try:
             return ImageFont.truetype(font_path, size)
         except:
@@ -91,53 +136,77 @@ def lerp(a, b, t):
     return a + (b - a) * t
 
 def lerp_color(c1, c2, t):
-    t = clamp(t, 0.0, 1.0)
-    return tuple(int(round(lerp(c1[i], c2[i], t))) for i in range(4))
-
-class HudRenderState:
-    def __init__(self, frame_rate):
-        safe_rate = frame_rate if frame_rate and frame_rate > 0 else 30.0
-        self.frame_rate = safe_rate
-        self.frame_dt_ms = 1000.0 / safe_rate
-        self.elapsed_ms = 0.0
-        self.steer_initialized = False
-        self.steer_target_deg = 0.0
-        self.steer_display_deg = 0.0
-        self.last_target_change_ms = 0.0
-
-    def advance(self):
-        self.elapsed_ms += self.frame_dt_ms
-
-    def blink_pulse(self):
-        phase = ((self.elapsed_ms / 1000.0) + 0.5) % 1.0  # start bright to mirror CSS keyframes
-        return 0.5 * (1 - math.cos(2 * math.pi * phase))
-
-    def smooth_steer(self, target_deg):
-        target = clamp(target_deg, -MAX_STEER_DEG, MAX_STEER_DEG)
-        if not self.steer_initialized:
-            self.steer_initialized = True
-            self.steer_target_deg = target
-            self.steer_display_deg = target
-            self.last_target_change_ms = self.elapsed_ms
+    t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+    # Channels are non-negative, so +0.5 and truncation rounds to nearest
+    return (
+        int(c1[0] + (c2[0] - c1[0]) * t + 0.5),
+        int(c1[1] + (c2[1] - c1[1]) * t + 0.5),
+        int(c1[2] + (c2[2] - c1[2]) * t + 0.5),
+        int(c1[3] + (c2[3] - c1[3]) * t + 0.5)
+    )
+
+def frame_interval_ms(frame_rate):
+    safe_rate = frame_rate if frame_rate and frame_rate > 0 else 30.0
+    return 1000.0 / safe_rate
+
+def blink_pulse_series(count, frame_dt_ms):
+    """Blinker pulse intensity (0-1) for each frame; frame i is shown at (i + 1) * frame_dt_ms"""
+    pulses = []
+    for i in range(count):
+        phase = (((i + 1) * frame_dt_ms / 1000.0) + 0.5) % 1.0  # start bright to mirror CSS keyframes
+        pulses.append(0.5 * (1 - math.cos(2 * math.pi * phase)))
+    return pulses
+
+def smooth_steer_series(targets, frame_dt_ms):
+    """Exponentially smoothed steering angle for each frame.
+    Frames without telemetry (None target) keep the clock running but don't touch the filter."""
+    smoothing = 1 - math.exp(-frame_dt_ms / 110.0) if frame_dt_ms > 0 else 1.0
+    initialized = False
+    target_deg = 0.0
+    display_deg = 0.0
+    last_target_change_ms = 0.0
+
+    display = []
+    for i, raw_target in enumerate(targets):
+        if raw_target is None:
+            display.append(None)
+            continue
+
+        elapsed_ms = (i + 1) * frame_dt_ms
+        target = clamp(raw_target, -MAX_STEER_DEG, MAX_STEER_DEG)
+        if not initialized:
+            initialized = True
+            target_deg = target
+            display_deg = target
+            last_target_change_ms = elapsed_ms
         else:
-            if target != self.steer_target_deg:
-                self.steer_target_deg = target
-                self.last_target_change_ms = self.elapsed_ms
+            if target != target_deg:
+                target_deg = target
+                last_target_change_ms = elapsed_ms
+
+            display_deg += (target_deg - display_deg) * smoothing
 
-            smoothing = 1 - math.exp(-self.frame_dt_ms / 110.0) if self.frame_dt_ms > 0 else 1.0
-            self.steer_display_deg += (self.steer_target_deg - self.steer_display_deg) * smoothing
+            if elapsed_ms - last_target_change_ms > 500.0:
+                display_deg = target_deg
 
-            if self.elapsed_ms - self.last_target_change_ms > 500.0:
-                self.steer_display_deg = self.steer_target_deg
+        display.append(display_deg)
+    return display
 
-        return self.steer_display_deg
+TRUTHY_STRINGS = frozenset(['true', '1', 'yes', 'on'])
+FALSY_STRINGS = frozenset(['false', '0', 'no', 'off'])
 
 def pick_number(data, keys, default=None):
     for key in keys:
-        if key not in data:
+        val = data.get(key)
+        if val is None:
+            continue
+        # JSON numbers are the common case; skip the exception-driven parse for them
+        if isinstance(val, (int, float)):
+            if val == val:  # not NaN
+                return float(val)
             continue
         try:
-            val = float(data[key])
+            val = float(val)
             if not math.isnan(val):
                 return val
         except (TypeError, ValueError):
@@ -153,13 +222,13 @@ def pick_bool(data, keys, default=False):
             return val != 0
         if isinstance(val, str):
             lowered = val.strip().lower()
-            if lowered in ['true', '1', 'yes', 'on']:
+            if lowered in TRUTHY_STRINGS:
                 return True
-            if lowered in ['false', '0', 'no', 'off']:
+            if lowered in FALSY_STRINGS:
                 return False
     return default
 
-def normalize_gear(raw):
+def gear_from_raw(raw):
     if raw is None:
         return 'P'
 
@@ -189,7 +258,7 @@ def normalize_gear(raw):
 
     return '?'
 
-def normalize_autopilot(raw):
+def autopilot_from_raw(raw):
     if raw is None:
         return 'NONE'
 
@@ -210,6 +279,82 @@ def normalize_autopilot(raw):
     }
     return aliases.get(state, state or 'NONE')
 
+# JSON scalars repeat on nearly every frame; lists/dicts are unhashable and skip the cache
+cached_gear_from_raw = lru_cache(maxsize=None)(gear_from_raw)
+cached_autopilot_from_raw = lru_cache(maxsize=None)(autopilot_from_raw)
+
+def normalize_gear(raw):
+    if raw is None or isinstance(raw, (str, int, float)):
+        return cached_gear_from_raw(raw)
+    return gear_from_raw(raw)
+
+def normalize_autopilot(raw):
+    if raw is None or isinstance(raw, (str, int, float)):
+        return cached_autopilot_from_raw(raw)
+    return autopilot_from_raw(raw)
+
+def parse_telemetry(telemetry, use_mph):
+    """Extract the values the HUD displays from a single SEI message"""
+    speed_mps = pick_number(telemetry, ['vehicleSpeedMps', 'vehicle_speed_mps', 'speed_mps'], 0) or 0
+    speed_mph = speed_mps * 2.23694
+    speed = speed_mph if use_mph else speed_mph * 1.60934
+
+    gear = telemetry.get('gearState') or telemetry.get('gear_state') or telemetry.get('gear')
+    brake = pick_bool(telemetry, ['brakeApplied', 'brake_applied'], False)
+    # throttlePct comes pre-normalized to 0-100 by HudRendererService — use it as-is;
+    # re-applying the 0-1 heuristic would inflate genuinely low values (e.g. 1% -> 100%).
+    throttle_raw = pick_number(telemetry, ['throttlePct'], None)
+    if throttle_raw is None:
+        throttle_raw = pick_number(telemetry, ['acceleratorPedalPosition', 'accelerator_pedal_position'], 0) or 0
+        if throttle_raw <= 1.2:  # some payloads report 0-1 range; same threshold as sei-hud.js/HudRendererService
+            throttle_raw *= 100
+    throttle = clamp(throttle_raw / 100.0, 0.0, 1.0)
+    steering_angle = pick_number(telemetry, ['steeringWheelAngle', 'steering_wheel_angle'], 0) or 0
+    left_blinker = pick_bool(telemetry, ['leftBlinkerOn', 'blinker_on_left'], False)
+    right_blinker = pick_bool(telemetry, ['rightBlinkerOn', 'blinker_on_right'], False)
+    autopilot_raw = telemetry.get('autopilotState') or telemetry.get('autopilot_state') or 'NONE'
+
+    return {
+        'speed': speed,
+        'gear': gear,
+        'brake': brake,
+        'throttle': throttle,
+        'steer': steering_angle,
+        'left_blinker': left_blinker,
+        'right_blinker': right_blinker,
+        'autopilot': normalize_autopilot(autopilot_raw),
+    }
+
+def preprocess_messages(messages, frame_rate, use_mph):
+    """Parse every SEI message once and precompute the time-dependent values.
+
+    Returns a dict of per-frame lists. 'telemetry' holds the parsed values (None for frames
+    without SEI data), 'steer' the smoothed wheel angle and 'blink_pulse' the blinker intensity.
+    """
+    frame_dt_ms = frame_interval_ms(frame_rate)
+    telemetry = []
+    latitude = []
+    longitude = []
+    for message in messages:
+        if message is None:
+            telemetry.append(None)
+            latitude.append(None)
+            longitude.append(None)
+            continue
+        telemetry.append(parse_telemetry(message, use_mph))
+        # Extract GPS coordinates from SEI telemetry (if available)
+        latitude.append(pick_number(message, ['latitude', 'latitudeDeg', 'latitude_deg'], None))
+        longitude.append(pick_number(message, ['longitude', 'longitudeDeg', 'longitude_deg'], None))
+
+    steer_targets = [t['steer'] if t is not None else None for t in telemetry]
+    return {
+        'telemetry': telemetry,
+        'latitude': latitude,
+        'longitude': longitude,
+        'steer': smooth_steer_series(steer_targets, frame_dt_ms),
+        'blink_pulse': blink_pulse_series(len(messages), frame_dt_ms),
+    }
+
 def draw_rounded_rectangle(draw, xy, radius, fill=None, outline=None, width=1):
     """Draw a rounded rectangle without outline self-intersections."""
     x1, y1, x2, y2 = xy
@@ -229,21 +374,50 @@ def draw_rounded_rectangle(draw, xy, radius, fill=None, outline=None, width=1):
 def draw_chip_background(draw, box, radius=CHIP_RADIUS, fill=None, outline=None, outline_width=1):
     draw_rounded_rectangle(draw, box, radius, fill=fill, outline=outline, width=outline_width)
 
-def draw_blinker_chip(draw, x, y, active, direction='left', pulse=1.0):
+def blink_pulse_step(pulse):
+    return int(clamp(pulse, 0.0, 1.0) * BLINK_PULSE_STEPS + 0.5)
+
+@lru_cache(maxsize=None)
+def active_blinker_colors(pulse_step):
+    """Fill, outline and arrow colors of a lit blinker at pulse_step / BLINK_PULSE_STEPS"""
+    pulse = pulse_step / BLINK_PULSE_STEPS
+    return (
+        lerp_color(BLINKER_IDLE_FILL, (24, 36, 26, 210), 0.65 + 0.25 * pulse),
+        lerp_color(HUD_BORDER_COLOR, (140, 255, 170, 180), 0.4 + 0.4 * pulse),
+        lerp_color(BLINKER_IDLE_ARROW, BLINKER_COLOR, 0.65 + 0.35 * pulse)
+    )
+
+def draw_blinker_chip(img, draw, x, y, active, direction='left', pulse=1.0):
     box = [x, y, x + CHIP_SIZE, y + CHIP_SIZE]
     pulse = clamp(pulse, 0.0, 1.0)
 
-    base_fill = (22, 24, 26, 175)
-    base_outline = HUD_BORDER_COLOR
     if active:
-        base_fill = lerp_color(base_fill, (24, 36, 26, 210), 0.65 + 0.25 * pulse)
-        base_outline = lerp_color(base_outline, (140, 255, 170, 180), 0.4 + 0.4 * pulse)
+        base_fill, base_outline, arrow_color = active_blinker_colors(blink_pulse_step(pulse))
+    else:
+        base_fill, base_outline, arrow_color = BLINKER_IDLE_FILL, HUD_BORDER_COLOR, BLINKER_IDLE_ARROW
 
     draw_chip_background(draw, box, fill=base_fill, outline=base_outline, outline_width=2)
 
+    arrow_img = arrow_sprite(direction, arrow_color)
+    img.alpha_composite(arrow_img, dest=(x, y))
+
+def tint_mask(mask, color):
+    """Build an RGBA sprite of a single color using an antialiased L mask as coverage"""
+    r, g, b, a = color
+    sprite = Image.new('RGBA', mask.size, (r, g, b, 0))
+    sprite.putalpha(mask if a == 255 else mask.point(lambda v: (v * a + 127) // 255))
+    return sprite
+
+@lru_cache(maxsize=None)
+def arrow_sprite(direction, color):
+    return tint_mask(arrow_mask(direction), color)
+
+@lru_cache(maxsize=None)
+def arrow_mask(direction):
+    """Blinker arrow coverage mask, shared by every arrow color"""
     # Render arrow at higher resolution for smoother edges
     ss_size = CHIP_SIZE * ICON_SUPERSAMPLE
-    arrow_img = Image.new('RGBA', (ss_size, ss_size), (0, 0, 0, 0))
+    arrow_img = Image.new('L', (ss_size, ss_size), 0)
     arrow_draw = ImageDraw.Draw(arrow_img)
 
     cx = ss_size / 2
@@ -263,20 +437,29 @@ def draw_blinker_chip(draw, x, y, active, direction='left', pulse=1.0):
             (cx - arrow * 0.65, cy + arrow)
         ]
 
-    arrow_base = (210, 210, 210, 170)
-    arrow_color = lerp_color(arrow_base, BLINKER_COLOR, 0.65 + 0.35 * pulse) if active else arrow_base
-    arrow_draw.polygon(points, fill=arrow_color)
+    arrow_draw.polygon(points, fill=255)
 
     # Scale down to target size with high-quality resampling
-    arrow_img = arrow_img.resize((CHIP_SIZE, CHIP_SIZE), Image.LANCZOS)
-    draw._image.paste(arrow_img, (x, y), arrow_img)
+    return arrow_img.resize((CHIP_SIZE, CHIP_SIZE), Image.LANCZOS)
 
-def draw_brake_icon(draw, center, size, color):
-    """Draw brake pedal icon with supersampling for better quality"""
+def draw_brake_icon(img, center, size, color):
+    """Draw brake pedal icon from the cached sprite"""
+    icon_img = brake_sprite(color, size)
+    offset_x = int(center[0] - size / 2)
+    offset_y = int(center[1] - size / 2)
+    img.alpha_composite(icon_img, dest=(offset_x, offset_y))
+
+@lru_cache(maxsize=None)
+def brake_sprite(color, size):
+    return tint_mask(brake_mask(size), color)
+
+@lru_cache(maxsize=None)
+def brake_mask(size):
+    """Render the brake pedal coverage mask with supersampling for better quality"""
     # Render at higher resolution
     ss_factor = ICON_SUPERSAMPLE
     ss_size = int(size * ss_factor)
-    icon_img = Image.new('RGBA', (ss_size, ss_size), (0, 0, 0, 0))
+    icon_img = Image.new('L', (ss_size, ss_size), 0)
     icon_draw = ImageDraw.Draw(icon_img)
 
     cx = cy = ss_size / 2
@@ -284,28 +467,37 @@ def draw_brake_icon(draw, center, size, color):
     outline_points = [(6, 7), (18, 7), (20, 16), (12, 19), (4, 16)]
     scaled_outline = [(cx + (px - 12) * scale, cy + (py - 12) * scale) for px, py in outline_points]
 
-    icon_draw.line(scaled_outline + [scaled_outline[0]], fill=color, width=max(2, int(2 * scale)))
+    icon_draw.line(scaled_outline + [scaled_outline[0]], fill=255, width=max(2, int(2 * scale)))
 
     for x in [8, 10, 12, 14, 16]:
         x_pos = cx + (x - 12) * scale
         icon_draw.line(
             [(x_pos, cy + (9 - 12) * scale), (x_pos, cy + (14 - 12) * scale)],
-            fill=color,
+            fill=255,
             width=max(1, int(1.4 * scale))
         )
 
-    # Scale down and composite
-    icon_img = icon_img.resize((int(size), int(size)), Image.LANCZOS)
+    # Scale down to target size
+    return icon_img.resize((int(size), int(size)), Image.LANCZOS)
+
+def draw_throttle_icon(img, center, size, color):
+    """Draw throttle pedal icon from the cached sprite"""
+    icon_img = throttle_sprite(color, size)
     offset_x = int(center[0] - size / 2)
     offset_y = int(center[1] - size / 2)
-    draw._image.paste(icon_img, (offset_x, offset_y), icon_img)
+    img.alpha_composite(icon_img, dest=(offset_x, offset_y))
+
+@lru_cache(maxsize=None)
+def throttle_sprite(color, size):
+    return tint_mask(throttle_mask(size), color)
 
-def draw_throttle_icon(draw, center, size, color):
-    """Draw throttle pedal icon with supersampling for better quality"""
+@lru_cache(maxsize=None)
+def throttle_mask(size):
+    """Render the throttle pedal coverage mask with supersampling for better quality"""
     # Render at higher resolution
     ss_factor = ICON_SUPERSAMPLE
     ss_size = int(size * ss_factor)
-    icon_img = Image.new('RGBA', (ss_size, ss_size), (0, 0, 0, 0))
+    icon_img = Image.new('L', (ss_size, ss_size), 0)
     icon_draw = ImageDraw.Draw(icon_img)
 
     cx = cy = ss_size / 2
@@ -313,23 +505,32 @@ def draw_throttle_icon(draw, center, size, color):
     outline_points = [(9, 4), (15, 4), (16, 18), (12, 20), (8, 18)]
     scaled_outline = [(cx + (px - 12) * scale, cy + (py - 12) * scale) for px, py in outline_points]
 
-    icon_draw.line(scaled_outline + [scaled_outline[0]], fill=color, width=max(2, int(2 * scale)))
+    icon_draw.line(scaled_outline + [scaled_outline[0]], fill=255, width=max(2, int(2 * scale)))
 
     rect_top = cy + (2 - 12) * scale
     icon_draw.rectangle(
         [cx - 3 * scale, rect_top, cx + 3 * scale, rect_top + 2 * scale],
-        outline=color,
+        outline=255,
         width=max(2, int(2 * scale))
     )
 
-    # Scale down and composite
-    icon_img = icon_img.resize((int(size), int(size)), Image.LANCZOS)
-    offset_x = int(center[0] - size / 2)
-    offset_y = int(center[1] - size / 2)
-    draw._image.paste(icon_img, (offset_x, offset_y), icon_img)
+    # Scale down to target size
+    return icon_img.resize((int(size), int(size)), Image.LANCZOS)
+
+def pedal_inner_box(x, y):
+    return [x + 7, y + 7, x + CHIP_SIZE - 7, y + CHIP_SIZE - 7]
 
-def draw_pedal_chip(draw, x, y, value, color, icon_kind, font_small):
+def draw_pedal_chrome(draw, x, y, fill=(24, 24, 26, 200), outline=HUD_BORDER_COLOR):
+    """Draw the pedal chip background and its inner track"""
     box = [x, y, x + CHIP_SIZE, y + CHIP_SIZE]
+    draw_chip_background(draw, box, fill=fill, outline=outline, outline_width=2)
+    draw_rounded_rectangle(draw, pedal_inner_box(x, y), CHIP_INNER_RADIUS, fill=(8, 8, 10, 190), outline=(255, 255, 255, 24), width=1)
+
+def pedal_fill_height(value):
+    inner = pedal_inner_box(0, 0)
+    return int((inner[3] - inner[1]) * clamp(value, 0.0, 1.0))
+
+def draw_pedal_chip(img, draw, x, y, value, color, icon_kind, draw_chrome=True):
     active = value > 0
 
     outline_color = HUD_BORDER_COLOR
@@ -340,13 +541,13 @@ def draw_pedal_chip(draw, x, y, value, color, icon_kind, font_small):
         icon_color = (255, 190, 190, 240)
         base_fill = (40, 16, 16, 210)
 
-    draw_chip_background(draw, box, fill=base_fill, outline=outline_color, outline_width=2)
+    # The throttle chrome never changes and comes from the static template
+    if draw_chrome:
+        draw_pedal_chrome(draw, x, y, fill=base_fill, outline=outline_color)
 
-    inner = [x + 7, y + 7, x + CHIP_SIZE - 7, y + CHIP_SIZE - 7]
-    draw_rounded_rectangle(draw, inner, CHIP_INNER_RADIUS, fill=(8, 8, 10, 190), outline=(255, 255, 255, 24), width=1)
+    inner = pedal_inner_box(x, y)
 
-    clamped = clamp(value, 0.0, 1.0)
-    fill_height = int((inner[3] - inner[1]) * clamped)
+    fill_height = pedal_fill_height(value)
     if fill_height > 0:
         fill_box = [inner[0] + 1, inner[3] - fill_height, inner[2] - 1, inner[3]]
         draw_rounded_rectangle(draw, fill_box, CHIP_INNER_RADIUS, fill=color)
@@ -354,20 +555,22 @@ def draw_pedal_chip(draw, x, y, value, color, icon_kind, font_small):
     icon_center = (inner[0] + (inner[2] - inner[0]) / 2, inner[1] + (inner[3] - inner[1]) / 2)
     icon_size = 24
     if icon_kind == 'brake':
-        draw_brake_icon(draw, icon_center, icon_size, icon_color)
+        draw_brake_icon(img, icon_center, icon_size, icon_color)
     else:
-        draw_throttle_icon(draw, icon_center, icon_size, icon_color)
+        draw_throttle_icon(img, icon_center, icon_size, icon_color)
+
+def speed_block_box(x, y):
+    return [x - SPEED_BLOCK_HALF_W, y - SPEED_BLOCK_HALF_H, x + SPEED_BLOCK_HALF_W, y + SPEED_BLOCK_HALF_H]
 
-def draw_speed_block(draw, x, y, speed, unit, font_large, font_small):
-    speed_box = [x - SPEED_BLOCK_HALF_W, y - SPEED_BLOCK_HALF_H, x + SPEED_BLOCK_HALF_W, y + SPEED_BLOCK_HALF_H]
+def draw_speed_block_chrome(draw, x, y, unit, font_large, font_small):
+    """Draw the speed block background and unit label (everything but the number)"""
+    speed_box = speed_block_box(x, y)
     draw_chip_background(draw, speed_box, radius=22, fill=(18, 20, 24, 185), outline=HUD_BORDER_COLOR, outline_width=2)
 
-    speed_text = f"{int(speed)}"
-    bbox = draw.textbbox((0, 0), speed_text, font=font_large)
-    text_w = bbox[2] - bbox[0]
-    text_h = bbox[3] - bbox[1]
+    # Reserve room for the tallest digit so the label position doesn't depend on the speed
+    digits_bbox = draw.textbbox((0, 0), "0123456789", font=font_large)
+    text_h = digits_bbox[3] - digits_bbox[1]
     speed_y = speed_box[1] + 4
-    draw.text((x - text_w // 2, speed_y), speed_text, fill=HUD_TEXT_COLOR, font=font_large)
 
     unit_bbox = draw.textbbox((0, 0), unit, font=font_small)
     unit_w = unit_bbox[2] - unit_bbox[0]
@@ -375,10 +578,34 @@ def draw_speed_block(draw, x, y, speed, unit, font_large, font_small):
     unit_y = speed_box[3] - unit_h - 4
     unit_y = max(unit_y, speed_y + text_h + 4)  # ensure no overlap
     draw.text((x - unit_w // 2, unit_y), unit, fill=(210, 210, 210, 210), font=font_small)
-    return speed_box
 
-def draw_gear_chip(draw, x, y, gear, font):
+@lru_cache(maxsize=None)
+def text_mask(text, font):
+    """Antialiased L coverage mask of text and its bbox relative to the draw origin.
+    Speeds and gears only take a few hundred distinct values, so glyph layout runs once per string."""
+    bbox = font.getbbox(text)
+    mask = Image.new('L', (max(1, bbox[2] - bbox[0]), max(1, bbox[3] - bbox[1])), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+    return mask, bbox
+
+def draw_text_mask(img, xy, mask, bbox, fill):
+    """Equivalent of draw.text(xy, ..., fill=fill) using a mask from text_mask"""
+    x = xy[0] + bbox[0]
+    y = xy[1] + bbox[1]
+    img.paste(fill, (x, y, x + mask.width, y + mask.height), mask)
+
+def draw_speed_block(img, x, y, speed, font_large):
+    speed_box = speed_block_box(x, y)
+    mask, bbox = text_mask(f"{int(speed)}", font_large)
+    text_w = bbox[2] - bbox[0]
+    speed_y = speed_box[1] + 4
+    draw_text_mask(img, (x - text_w // 2, speed_y), mask, bbox, HUD_TEXT_COLOR)
+
+def draw_gear_chrome(draw, x, y):
     box = [x, y, x + CHIP_SIZE, y + CHIP_SIZE]
+    draw_chip_background(draw, box, fill=(20, 20, 22, 200), outline=HUD_BORDER_COLOR, outline_width=2)
+
+def draw_gear_chip(img, x, y, gear, font):
     gear_text = normalize_gear(gear)
     gear_colors = {
         'P': (240, 240, 240, 255),
@@ -388,18 +615,20 @@ def draw_gear_chip(draw, x, y, gear, font):
     }
     text_color = gear_colors.get(gear_text, HUD_TEXT_COLOR)
 
-    draw_chip_background(draw, box, fill=(20, 20, 22, 200), outline=HUD_BORDER_COLOR, outline_width=2)
-
-    bbox = draw.textbbox((0, 0), gear_text, font=font)
+    mask, bbox = text_mask(gear_text, font)
     text_w = bbox[2] - bbox[0]
     text_h = bbox[3] - bbox[1]
     center_x = x + CHIP_SIZE / 2
     center_y = y + CHIP_SIZE / 2
     text_x = int(round(center_x - text_w / 2))
     text_y = int(round(center_y - text_h / 2 - 3))  # nudge up to optically center
-    draw.text((text_x, text_y), gear_text, fill=text_color, font=font)
+    draw_text_mask(img, (text_x, text_y), mask, bbox, text_color)
+
+def wheel_rotation(angle):
+    # Quantize to whole degrees so rotated sprites can be reused; a full turn looks the same
+    return int(round(clamp(angle, -MAX_STEER_DEG, MAX_STEER_DEG))) % 360
 
-def draw_wheel_chip(draw, x, y, angle, autopilot_state):
+def draw_wheel_chip(img, draw, x, y, angle, autopilot_state):
     box = [x, y, x + CHIP_SIZE, y + CHIP_SIZE]
     autopilot_state = normalize_autopilot(autopilot_state)
     is_autopilot = autopilot_state in ['AUTOSTEER', 'SELF_DRIVING']
@@ -417,9 +646,28 @@ def draw_wheel_chip(draw, x, y, angle, autopilot_state):
 
     draw_chip_background(draw, box, fill=base_fill, outline=outline, outline_width=2)
 
+    wheel_img = wheel_sprite(wheel_rotation(angle), icon_color)
+    img.alpha_composite(wheel_img, dest=(x, y))
+
+@lru_cache(maxsize=None)
+def wheel_sprite(angle_deg, color):
+    return tint_mask(wheel_mask(angle_deg), color)
+
+@lru_cache(maxsize=None)
+def wheel_mask(angle_deg):
+    """Wheel coverage mask rotated by angle_deg and scaled down to chip size"""
+    # Rotate at high resolution for better quality
+    wheel_img = upright_wheel_mask().rotate(-angle_deg, resample=Image.BICUBIC)
+
+    # Scale down to target size with high-quality Lanczos resampling
+    return wheel_img.resize((CHIP_SIZE, CHIP_SIZE), Image.LANCZOS)
+
+@lru_cache(maxsize=None)
+def upright_wheel_mask():
+    """Unrotated wheel coverage mask at supersampled resolution"""
     # Render wheel icon at higher resolution for better quality
     ss_size = CHIP_SIZE * ICON_SUPERSAMPLE
-    wheel_img = Image.new('RGBA', (ss_size, ss_size), (0, 0, 0, 0))
+    wheel_img = Image.new('L', (ss_size, ss_size), 0)
     wheel_draw = ImageDraw.Draw(wheel_img)
     center = ss_size / 2
 
@@ -431,7 +679,7 @@ def draw_wheel_chip(draw, x, y, angle, autopilot_state):
     outer_radius = 8 * scale
     wheel_draw.ellipse(
         [center - outer_radius, center - outer_radius, center + outer_radius, center + outer_radius],
-        outline=icon_color,
+        outline=255,
         width=max(2, int(1.4 * scale))
     )
 
@@ -441,7 +689,7 @@ def draw_wheel_chip(draw, x, y, angle, autopilot_state):
     bar_x2 = center + (17.2 - 12) * scale
     wheel_draw.line(
         [(bar_x1, bar_y), (bar_x2, bar_y)],
-        fill=icon_color,
+        fill=255,
         width=max(2, int(2 * scale))
     )
 
@@ -451,7 +699,7 @@ def draw_wheel_chip(draw, x, y, angle, autopilot_state):
     bar_y2 = center + (16.8 - 12) * scale
     wheel_draw.line(
         [(bar_x, bar_y1), (bar_x, bar_y2)],
-        fill=icon_color,
+        fill=255,
         width=max(2, int(2 * scale))
     )
 
@@ -459,20 +707,57 @@ def draw_wheel_chip(draw, x, y, angle, autopilot_state):
     hub_radius = 1.8 * scale
     wheel_draw.ellipse(
         [center - hub_radius, center - hub_radius, center + hub_radius, center + hub_radius],
-        outline=icon_color,
+        outline=255,
         width=max(1, int(1.4 * scale))
     )
+    return wheel_img
 
-    # Rotate at high resolution for better quality
-    rotation_angle = clamp(angle, -MAX_STEER_DEG, MAX_STEER_DEG)
-    wheel_img = wheel_img.rotate(-rotation_angle, resample=Image.BICUBIC)
+def draw_location_box(draw, x, y, full_text, font):
+    """Draw the location box with its top-left corner at (x, y); returns the box height"""
+    bbox = draw.textbbox((0, 0), full_text, font=font)
+    text_w = bbox[2] - bbox[0]
+    text_h = bbox[3] - bbox[1]
 
-    # Scale down to target size with high-quality Lanczos resampling
-    wheel_img = wheel_img.resize((CHIP_SIZE, CHIP_SIZE), Image.LANCZOS)
-    draw._image.paste(wheel_img, (x, y), wheel_img)
+    # Background box dimensions
+    box_w = text_w + LOCATION_PADDING * 2
+    box_h = text_h + LOCATION_PADDING * 2
+
+    # Draw semi-transparent black background
+    draw_rounded_rectangle(
+        draw,
+        [x, y, x + box_w, y + box_h],
+        radius=6,
+        fill=LOCATION_BG_COLOR
+    )
+
+    # Draw text
+    draw.text((x + LOCATION_PADDING, y + LOCATION_PADDING), full_text, fill=LOCATION_TEXT_COLOR, font=font)
+    return box_h
+
+# GPS text keeps changing along a drive, so old strings rarely return; keep only a few
+@lru_cache(maxsize=8)
+def location_sprite(full_text, font):
+    """Render the location box and text once per distinct string.
+
+    Returns (sprite, left, top, box_h) where (left, top) is the sprite origin relative to the
+    box's top-left corner (glyphs can hang past the padded box) and box_h is the box height.
+    """
+    measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    bbox = measure.textbbox((0, 0), full_text, font=font)
+    box_w = bbox[2] - bbox[0] + LOCATION_PADDING * 2
+    box_h = bbox[3] - bbox[1] + LOCATION_PADDING * 2
 
-def draw_location_overlay(draw, width, height, location_text, latitude, longitude, fallback_lat, fallback_lon, font):
-    """Draw location overlay at bottom-left corner
+    left = min(0, LOCATION_PADDING + bbox[0])
+    top = min(0, LOCATION_PADDING + bbox[1])
+    right = max(box_w, LOCATION_PADDING + bbox[2]) + 1
+    bottom = max(box_h, LOCATION_PADDING + bbox[3]) + 1
+
+    sprite = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+    draw_location_box(ImageDraw.Draw(sprite), -left, -top, full_text, font)
+    return sprite, left, top, box_h
+
+def format_location_text(location_text, latitude, longitude, fallback_lat, fallback_lon):
+    """Build the location overlay string, or None if there is nothing to show
 
     Args:
         location_text: Street/city text from event.json (e.g., "Main St, San Francisco")
@@ -481,22 +766,14 @@ def draw_location_overlay(draw, width, height, location_text, latitude, longitud
         fallback_lat: Fallback latitude from event.json
         fallback_lon: Fallback longitude from event.json
     """
-    sys.stderr.write(f"[LOCATION DEBUG] draw_location_overlay called: location_text={location_text}, latitude={latitude}, longitude={longitude}, fallback_lat={fallback_lat}, fallback_lon={fallback_lon}\n")
-    sys.stderr.flush()
-
     # Determine which GPS to use (SEI or fallback)
     gps_lat = latitude
     gps_lon = longitude
 
     # Use fallback if SEI GPS is missing or invalid
     if gps_lat is None or gps_lon is None or (gps_lat == 0.0 and gps_lon == 0.0):
-        sys.stderr.write(f"[LOCATION DEBUG] SEI GPS invalid/missing, using fallback: fallback_lat={fallback_lat}, fallback_lon={fallback_lon}\n")
-        sys.stderr.flush()
         gps_lat = fallback_lat
         gps_lon = fallback_lon
-    else:
-        sys.stderr.write(f"[LOCATION DEBUG] Using SEI GPS: {gps_lat}, {gps_lon}\n")
-        sys.stderr.flush()
 
     # Build location string
     parts = []
@@ -515,109 +792,68 @@ def draw_location_overlay(draw, width, height, location_text, latitude, longitud
 
     # If no location data at all, skip rendering
     if not parts:
-        sys.stderr.write("[LOCATION DEBUG] No location data to display - skipping render\n")
-        sys.stderr.flush()
-        return
+        return None
 
-    full_text = " ".join(parts)
-    sys.stderr.write(f"[LOCATION DEBUG] Rendering location text: {full_text}\n")
-    sys.stderr.flush()
+    return " ".join(parts)
 
-    # Measure text
-    bbox = draw.textbbox((0, 0), full_text, font=font)
-    text_w = bbox[2] - bbox[0]
-    text_h = bbox[3] - bbox[1]
-
-    # Background box dimensions
-    box_w = text_w + LOCATION_PADDING * 2
-    box_h = text_h + LOCATION_PADDING * 2
-
-    # Position at bottom-left (matching FFmpeg location)
-    box_x = LOCATION_MARGIN_X
-    box_y = height - box_h - LOCATION_MARGIN_Y
-
-    # Draw semi-transparent black background
-    draw_rounded_rectangle(
-        draw,
-        [box_x, box_y, box_x + box_w, box_y + box_h],
-        radius=6,
-        fill=LOCATION_BG_COLOR
-    )
-
-    # Draw text
-    text_x = box_x + LOCATION_PADDING
-    text_y = box_y + LOCATION_PADDING
-    draw.text((text_x, text_y), full_text, fill=LOCATION_TEXT_COLOR, font=font)
-
-def create_hud_frame(width, height, telemetry, use_mph, state=None, enable_location_overlay=False, location_text=None, fallback_lat=None, fallback_lon=None):
-    """Create a single HUD frame"""
-    # Create transparent image
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+def location_area(full_text, height, font):
+    """The (x1, y1, x2, y2) area the location overlay covers, at bottom-left like FFmpeg"""
+    sprite, left, top, box_h = location_sprite(full_text, font)
+    x = LOCATION_MARGIN_X + left
+    y = height - box_h - LOCATION_MARGIN_Y + top
+    return (x, y, x + sprite.width, y + sprite.height)
 
-    if state:
-        state.advance()
+def draw_location_overlay(img, height, full_text, font, in_place=False):
+    """Draw the formatted location text (see format_location_text) at the bottom-left corner
 
-    # Load fonts
-    font_large = load_font(34)
-    font_location = load_font(24)  # Match timestamp font size
-    font_medium = load_font(20)
-    font_small = load_font(11)
+    Args:
+        in_place: Draw over existing content instead of pasting the cached sprite, whose
+            transparent margins would otherwise overwrite it
 
+    Returns:
+        The (x1, y1, x2, y2) area that was drawn
+    """
+    # The formatted text is the cache key, so consecutive frames at one GPS fix share a sprite
+    sprite, left, top, _ = location_sprite(full_text, font)
+    area = location_area(full_text, height, font)
+    if in_place:
+        draw_location_box(ImageDraw.Draw(img), area[0] - left, area[1] - top, full_text, font)
+    else:
+        # The area underneath is still transparent, so a plain paste matches drawing in place
+        img.paste(sprite, area[:2])
+    return area
+
+@dataclass(frozen=True)
+class HudLayout:
+    """Fixed HUD positions for one output width"""
+    width: int
+    hud_x: int
+    hud_y: int
+    speed_xy: tuple
+    speed_box: tuple
+    chip_y: int
+    left_chip_xs: tuple
+    right_chip_xs: tuple
+
+def compute_layout(width):
+    """Compute the HUD layout once per render; nothing in it changes between frames"""
     # Calculate HUD position (centered horizontally, near bottom where blank space exists)
     hud_x = (width - HUD_WIDTH) // 2
     hud_y = HUD_MARGIN_TOP
 
-    # No pill background; render chips directly over video
-
-    # Extract GPS coordinates from SEI telemetry (if available)
-    latitude = pick_number(telemetry, ['latitude', 'latitudeDeg', 'latitude_deg'], None) if telemetry else None
-    longitude = pick_number(telemetry, ['longitude', 'longitudeDeg', 'longitude_deg'], None) if telemetry else None
-
-    # Draw location overlay at bottom-left (even if telemetry is None, we can use fallback GPS)
-    if enable_location_overlay:
-        draw_location_overlay(draw, width, height, location_text, latitude, longitude, fallback_lat, fallback_lon, font_location)
-
-    # Parse telemetry data for HUD rendering
-    if telemetry is None:
-        return img
-
-    speed_mps = pick_number(telemetry, ['vehicleSpeedMps', 'vehicle_speed_mps', 'speed_mps'], 0) or 0
-    speed_mph = speed_mps * 2.23694
-    speed = speed_mph if use_mph else speed_mph * 1.60934
-    unit = 'mph' if use_mph else 'km/h'
-
-    gear = telemetry.get('gearState') or telemetry.get('gear_state') or telemetry.get('gear')
-    brake = pick_bool(telemetry, ['brakeApplied', 'brake_applied'], False)
-    # throttlePct comes pre-normalized to 0-100 by HudRendererService — use it as-is;
-    # re-applying the 0-1 heuristic would inflate genuinely low values (e.g. 1% -> 100%).
-    throttle_raw = pick_number(telemetry, ['throttlePct'], None)
-    if throttle_raw is None:
-        throttle_raw = pick_number(telemetry, ['acceleratorPedalPosition', 'accelerator_pedal_position'], 0) or 0
-        if throttle_raw <= 1.2:  # some payloads report 0-1 range; same threshold as sei-hud.js/HudRendererService
-            throttle_raw *= 100
-    throttle = clamp(throttle_raw / 100.0, 0.0, 1.0)
-    steering_angle = pick_number(telemetry, ['steeringWheelAngle', 'steering_wheel_angle'], 0) or 0
-    left_blinker = pick_bool(telemetry, ['leftBlinkerOn', 'blinker_on_left'], False)
-    right_blinker = pick_bool(telemetry, ['rightBlinkerOn', 'blinker_on_right'], False)
-    autopilot_raw = telemetry.get('autopilotState') or telemetry.get('autopilot_state') or 'NONE'
-    autopilot = normalize_autopilot(autopilot_raw)
-    steer_display_angle = state.smooth_steer(steering_angle) if state else clamp(steering_angle, -MAX_STEER_DEG, MAX_STEER_DEG)
-    blinker_pulse = state.blink_pulse() if state else 1.0
-
     chip_y = hud_y + (HUD_HEIGHT - CHIP_SIZE) // 2
 
     speed_x = hud_x + HUD_WIDTH // 2
     speed_y = hud_y + HUD_HEIGHT // 2
     # Bottom flush with the chip row: the taller speed block takes its extra height upward,
     # keeping clearance from the video content that starts just below the HUD strip.
-    speed_box = draw_speed_block(draw, speed_x, speed_y - 4, speed, unit, font_large, font_small)
+    speed_xy = (speed_x, speed_y - 4)
+    speed_box = tuple(speed_block_box(*speed_xy))
 
     # symmetric spacing around the speed block
     LEFT_CHIPS = 3
     RIGHT_CHIPS = 3
     left_group_w = LEFT_CHIPS * CHIP_SIZE + (LEFT_CHIPS - 1) * CHIP_GAP
-    right_group_w = RIGHT_CHIPS * CHIP_SIZE + (RIGHT_CHIPS - 1) * CHIP_GAP
     gap = CHIP_GAP_WIDE
     pad = 2  # keep outlines/AA from touching
 
@@ -625,73 +861,311 @@ def create_hud_frame(width, height, telemetry, use_mph, state=None, enable_locat
     left_start = left_end - left_group_w
     right_start = speed_box[2] + gap + pad
 
-    # left group: blinker, gear, brake
-    current_x = left_start
-    draw_blinker_chip(draw, current_x, chip_y, left_blinker, 'left', pulse=blinker_pulse)
-    current_x += CHIP_SIZE + CHIP_GAP
+    return HudLayout(
+        width=width,
+        hud_x=hud_x,
+        hud_y=hud_y,
+        speed_xy=speed_xy,
+        speed_box=speed_box,
+        chip_y=chip_y,
+        left_chip_xs=tuple(left_start + i * (CHIP_SIZE + CHIP_GAP) for i in range(LEFT_CHIPS)),
+        right_chip_xs=tuple(right_start + i * (CHIP_SIZE + CHIP_GAP) for i in range(RIGHT_CHIPS))
+    )
 
-    draw_gear_chip(draw, current_x, chip_y, gear, font_medium)
-    current_x += CHIP_SIZE + CHIP_GAP
+@lru_cache(maxsize=None)
+def build_static_template(layout, use_mph):
+    """Render the HUD strip chrome that is identical on every frame (speed block, unit label,
+    gear and throttle chip backgrounds). Callers must copy() it before drawing."""
+    img = Image.new('RGBA', (layout.width, HUD_STRIP_HEIGHT), (0, 0, 0, 0))
+    draw_static_chrome(ImageDraw.Draw(img), layout, use_mph)
+    return img
 
-    brake_value = 1.0 if brake else 0.0
-    draw_pedal_chip(draw, current_x, chip_y, brake_value, BRAKE_COLOR, 'brake', font_small)
+def draw_static_chrome(draw, layout, use_mph):
+    unit = 'mph' if use_mph else 'km/h'
+    draw_speed_block_chrome(draw, *layout.speed_xy, unit, load_font(34), load_font(11))
+    draw_gear_chrome(draw, layout.left_chip_xs[1], layout.chip_y)
+    draw_pedal_chrome(draw, layout.right_chip_xs[1], layout.chip_y)
+
+# Full-frame canvas reused across frames in this process, and the areas the last frame drew on
+_canvas = None
+_canvas_dirty = []
+
+def frame_canvas(width, height):
+    """Return the process-wide transparent canvas, clearing only what the previous frame drew"""
+    global _canvas
+    if _canvas is None or _canvas.size != (width, height):
+        _canvas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    else:
+        for box in _canvas_dirty:
+            _canvas.paste((0, 0, 0, 0), box)
+    _canvas_dirty.clear()
+    return _canvas
 
-    # right group: wheel, throttle, blinker
-    current_x = right_start
-    draw_wheel_chip(draw, current_x, chip_y, steer_display_angle, autopilot)
-    current_x += CHIP_SIZE + CHIP_GAP
+def create_hud_frame(width, height, layout, frames, index, use_mph, enable_location_overlay=False, location_text=None, fallback_lat=None, fallback_lon=None):
+    """Create HUD frame `index` from the output of preprocess_messages.
+    The returned image is reused by the next call, so consume it (tobytes/save) first."""
+    img = frame_canvas(width, height)
+
+    # Load fonts
+    font_large = load_font(34)
+    font_location = load_font(24)  # Match timestamp font size
+    font_medium = load_font(20)
+
+    # No pill background; render chips directly over video
+
+    # Location overlay at bottom-left (even if telemetry is None, we can use fallback GPS)
+    location = None
+    if enable_location_overlay:
+        location = format_location_text(location_text, frames['latitude'][index], frames['longitude'][index], fallback_lat, fallback_lon)
+
+    telemetry = frames['telemetry'][index]
+
+    # On short frames the location box reaches into the strip rows, where pasting the strip
+    # would wipe it. Draw those frames in place instead: chrome, location box, then chips.
+    draw_in_place = (
+        telemetry is not None
+        and location is not None
+        and location_area(location, height, font_location)[1] < HUD_STRIP_HEIGHT
+    )
+    if draw_in_place:
+        strip = img
+        draw = ImageDraw.Draw(strip)
+        draw_static_chrome(draw, layout, use_mph)
+
+    if location is not None:
+        _canvas_dirty.append(draw_location_overlay(img, height, location, font_location, in_place=draw_in_place))
+
+    if telemetry is None:
+        return img
+
+    steer_display_angle = frames['steer'][index]
+    blinker_pulse = frames['blink_pulse'][index]
+
+    if not draw_in_place:
+        # Draw into a copy of the cached strip chrome instead of the full frame, then blit it in once
+        strip = build_static_template(layout, use_mph).copy()
+        draw = ImageDraw.Draw(strip)
+
+    chip_y = layout.chip_y
+    left_xs = layout.left_chip_xs
+    right_xs = layout.right_chip_xs
+    draw_speed_block(strip, *layout.speed_xy, telemetry['speed'], font_large)
+
+    # left group: blinker, gear, brake
+    draw_blinker_chip(strip, draw, left_xs[0], chip_y, telemetry['left_blinker'], 'left', pulse=blinker_pulse)
+    draw_gear_chip(strip, left_xs[1], chip_y, telemetry['gear'], font_medium)
 
-    draw_pedal_chip(draw, current_x, chip_y, throttle, THROTTLE_COLOR, 'throttle', font_small)
-    current_x += CHIP_SIZE + CHIP_GAP
+    brake_value = 1.0 if telemetry['brake'] else 0.0
+    draw_pedal_chip(strip, draw, left_xs[2], chip_y, brake_value, BRAKE_COLOR, 'brake')
 
-    draw_blinker_chip(draw, current_x, chip_y, right_blinker, 'right', pulse=blinker_pulse)
+    # right group: wheel, throttle, blinker
+    draw_wheel_chip(strip, draw, right_xs[0], chip_y, steer_display_angle, telemetry['autopilot'])
+    draw_pedal_chip(strip, draw, right_xs[1], chip_y, telemetry['throttle'], THROTTLE_COLOR, 'throttle', draw_chrome=False)
+    draw_blinker_chip(strip, draw, right_xs[2], chip_y, telemetry['right_blinker'], 'right', pulse=blinker_pulse)
 
+    if not draw_in_place:
+        img.paste(strip, (0, 0))
+    _canvas_dirty.append((0, 0, width, HUD_STRIP_HEIGHT))
     return img
 
+def hud_frame_key(frames, index, location):
+    """Everything that decides the pixels of frame `index`, quantized the way the drawers
+    quantize it. Frames with equal keys render identically."""
+    telemetry = frames['telemetry'][index]
+    if telemetry is None:
+        return (location,)
+
+    left_blinker = telemetry['left_blinker']
+    right_blinker = telemetry['right_blinker']
+    pulse_step = blink_pulse_step(frames['blink_pulse'][index]) if left_blinker or right_blinker else None
+    return (
+        location,
+        f"{int(telemetry['speed'])}",
+        normalize_gear(telemetry['gear']),
+        telemetry['brake'],
+        pedal_fill_height(telemetry['throttle']),
+        wheel_rotation(frames['steer'][index]),
+        telemetry['autopilot'],
+        left_blinker,
+        right_blinker,
+        pulse_step
+    )
+
+def frame_keys(frames, args):
+    keys = []
+    for i in range(len(frames['telemetry'])):
+        location = None
+        if args.enable_location_overlay:
+            location = format_location_text(args.location_text, frames['latitude'][i], frames['longitude'][i], args.fallback_lat, args.fallback_lon)
+        keys.append(hud_frame_key(frames, i, location))
+    return keys
+
+# Per-process render inputs, set by init_worker
+_worker_frames = None
+_worker_args = None
+_worker_layout = None
+
+def init_worker(frames, args, layout):
+    global _worker_frames, _worker_args, _worker_layout
+    _worker_frames = frames
+    _worker_args = args
+    _worker_layout = layout
+
+# Key and output (bytes or file path) of the last frame this process rendered
+_last_frame_key = None
+_last_frame_output = None
+
+def reuse_frame(frame_path):
+    """Hardlink the previous identical frame file instead of encoding it again"""
+    temp_path = f"{frame_path}.tmp"
+    try:
+        os.link(_last_frame_output, temp_path)
+    except FileExistsError:
+        os.unlink(temp_path)
+        os.link(_last_frame_output, temp_path)
+    except OSError:
+        shutil.copyfile(_last_frame_output, temp_path)
+    os.replace(temp_path, frame_path)
+
+def render_frame(index):
+    """Render one frame in a worker: returns raw RGBA bytes in pipe mode, otherwise writes the PNG"""
+    global _last_frame_key, _last_frame_output
+    args = _worker_args
+    extension = 'rgba' if args.raw_frames else 'png'
+    frame_path = None if args.pipe else f"{args.output_dir}/frame_{index:06d}.{extension}"
+
+    # Telemetry often repeats across frames (speed updates far slower than the frame rate)
+    key = _worker_frames['key'][index]
+    if key == _last_frame_key:
+        if args.pipe:
+            return _last_frame_output
+        reuse_frame(frame_path)
+        return None
+
+    # Create HUD frame with location overlay
+    img = create_hud_frame(
+        args.width,
+        args.height,
+        _worker_layout,
+        _worker_frames,
+        index,
+        args.use_mph,
+        args.enable_location_overlay,
+        args.location_text,
+        args.fallback_lat,
+        args.fallback_lon
+    )
+
+    _last_frame_key = key
+
+    if args.pipe:
+        _last_frame_output = img.tobytes()
+        return _last_frame_output
+
+    _last_frame_output = frame_path
+    # Write beside the target and swap it in: a frame left by an earlier run may be a
+    # hardlink shared with other frames, and writing through it would change them all
+    temp_path = f"{frame_path}.tmp"
+    if args.raw_frames:
+        # Save as headerless RGBA; ffmpeg needs -pix_fmt rgba and -s WxH to read it
+        with open(temp_path, 'wb') as f:
+            f.write(img.tobytes())
+    else:
+        # Save as PNG file
+        img.save(temp_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    os.replace(temp_path, frame_path)
+    return None
+
+def render_chunk(start, stop):
+    """Render a run of consecutive frames in one worker so repeated frames can be reused"""
+    return [render_frame(i) for i in range(start, stop)]
+
+def default_workers():
+    """CPUs this process may actually use, honouring affinity and the cgroup v2 CPU quota"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, min(cpus, MAX_DEFAULT_WORKERS))
+
+def render_frames(frames, args, layout, total):
+    """Yield render_frame results in frame order, fanning out to a process pool when useful"""
+    workers = args.workers if args.workers and args.workers > 0 else default_workers()
+    workers = min(workers, max(total, 1))
+
+    if workers == 1:
+        init_worker(frames, args, layout)
+        for i in range(total):
+            yield render_frame(i)
+        return
+
+    # Pipe frames are held in memory until the reader takes them, so keep their chunks small
+    max_chunk = PIPE_CHUNK_FRAMES if args.pipe else FILE_CHUNK_FRAMES
+    chunksize = max(1, min(max_chunk, total // (workers * 4)))
+    max_pending = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+
+    with Pool(workers, initializer=init_worker, initargs=(frames, args, layout)) as pool:
+        # Only submit a new chunk once the oldest one has been consumed, so a slow reader
+        # stalls the workers instead of letting finished frames pile up in this process
+        pending = deque()
+        starts = iter(range(0, total, chunksize))
+        for start in starts:
+            pending.append(pool.apply_async(render_chunk, (start, min(start + chunksize, total))))
+            if len(pending) >= max_pending:
+                break
+
+        while pending:
+            results = pending.popleft().get()
+            start = next(starts, None)
+            if start is not None:
+                pending.append(pool.apply_async(render_chunk, (start, min(start + chunksize, total))))
+            yield from results
+
 def main():
+    global VERBOSE
     args = parse_args()
+    VERBOSE = args.verbose
 
-    sys.stderr.write(f"[LOCATION DEBUG] hud_renderer.py started with args: enable_location_overlay={args.enable_location_overlay}, location_text={args.location_text}, fallback_lat={args.fallback_lat}, fallback_lon={args.fallback_lon}\n")
-    sys.stderr.flush()
+    debug_log(f"[LOCATION DEBUG] hud_renderer.py started with args: enable_location_overlay={args.enable_location_overlay}, location_text={args.location_text}, fallback_lat={args.fallback_lat}, fallback_lon={args.fallback_lon}")
 
     # Load SEI messages
     messages = load_sei_messages(args.sei_json)
     total = len(messages)
-    state = HudRenderState(args.framerate)
+    frames = preprocess_messages(messages, args.framerate, args.use_mph)
+    layout = compute_layout(args.width)
+    frames['key'] = frame_keys(frames, args)
 
     sys.stderr.write(f"Rendering {total} HUD frames to {'pipe' if args.pipe else args.output_dir}...\n")
-    sys.stderr.flush()
-
-    for i, telemetry in enumerate(messages):
-        # Create HUD frame with location overlay
-        img = create_hud_frame(
-            args.width,
-            args.height,
-            telemetry,
-            args.use_mph,
-            state,
-            args.enable_location_overlay,
-            args.location_text,
-            args.fallback_lat,
-            args.fallback_lon
-        )
 
-        if args.pipe:
+    # Report progress every 1% rather than every few frames
+    progress_step = max(1, total // 100)
+
+    # Let the pipe backpressure pace us instead of flushing every frame
+    out = io.BufferedWriter(sys.stdout.buffer, buffer_size=PIPE_BUFFER_SIZE) if args.pipe else None
+
+    for i, frame_bytes in enumerate(render_frames(frames, args, layout, total)):
+        if out:
             # Output raw RGBA to stdout
-            sys.stdout.buffer.write(img.tobytes())
-            sys.stdout.buffer.flush()
-        else:
-            # Save as PNG file
-            frame_path = f"{args.output_dir}/frame_{i:06d}.png"
-            img.save(frame_path, 'PNG')
+            out.write(frame_bytes)
 
         # Progress reporting
-        if (i + 1) % 10 == 0 or (i + 1) == total:
+        if (i + 1) % progress_step == 0 or (i + 1) == total:
             sys.stderr.write(f"\rRendered {i+1}/{total} frames ({(i+1)/total*100:.1f}%)")
             sys.stderr.flush()
 
+    if out:
+        out.flush()
+
     sys.stderr.write("\nHUD rendering complete\n")
-    sys.stderr.flush()
 
 if __name__ == '__main__':
     try: